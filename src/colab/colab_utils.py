@@ -18,6 +18,7 @@ import collections
 import io
 import json
 import os
+import posixpath
 import re
 import subprocess
 import tempfile
@@ -359,8 +360,8 @@ def run_example_generation(generate_examples_args,
         total_example_counter = 0
         for k in range(20):
           file_directory = f'unlabeled/unlabeled-000{k:02d}-of-00020.tfrecord'
-          tfrecord_path = os.path.join(
-              os.path.join(generate_examples_args['output_dir'], 'examples'),
+          tfrecord_path = posixpath.join(
+              posixpath.join(generate_examples_args['output_dir'], 'examples'),
               file_directory)
           total_example_counter += count_tfrecord(tfrecord_path)
         print(
@@ -956,8 +957,8 @@ def get_epoch_number(path_experiment, id_eval_job, checkpoint_selection,
                      checkpoint_index):
   """Return the epoch number of choosen method or a specific checkpoint."""
   if checkpoint_selection == 'most_recent':
-    most_recent_epoch_file = os.path.join(f'gs://{path_experiment}',
-                                          'checkpoints', 'last_processed_epoch')
+    most_recent_epoch_file = posixpath.join(
+        f'gs://{path_experiment}', 'checkpoints', 'last_processed_epoch')
     os.system(f'gsutil cp {most_recent_epoch_file} /tmp/last_processed_epoch')
     with open('/tmp/last_processed_epoch', 'r') as epoch_f:
       epoch_num = epoch_f.read()
@@ -1100,8 +1101,9 @@ def run_inference_and_prediction_job(run_infer_args,
         job_state = 'DONE'
         print(f'Inference CustomJob state: {job_state}')
       progress_bar.update({'value': 100, 'max': 100})
-      preds_file = os.path.join(f'{run_infer_args["train_dir"]}', 'predictions',
-                                f'test_ckpt_{int(epoch)}.geojson')
+      preds_file = posixpath.join(
+          f'{run_infer_args["train_dir"]}', 'predictions',
+          f'test_ckpt_{int(epoch)}.geojson')
       os.system(f'gsutil cp {preds_file} /tmp/predictions.geojson')
       print(f'Predictions saved in :\n{preds_file}')
     else:
@@ -39,13 +39,12 @@ python create_cloud_labeling_task.py \
 # pylint: enable=line-too-long
 
 
-import time
-
 from absl import app
 from absl import flags
 from absl import logging
 
 from skai import cloud_labeling
+from skai import utils
 
 FLAGS = flags.FLAGS
 flags.DEFINE_string('cloud_project', 'disaster-assessment', 'GCP project name.')
@@ -88,28 +87,8 @@ flags.DEFINE_string(
     'If specified, only allow example ids found in this text file.')
 
 
-def _get_labeling_dataset_region(project_region: str) -> str:
-  """Choose where to host a labeling dataset.
-
-  As of November 2021, labeling datasets can only be created in "us-central1"
-  and "europe-west4" regions. See
-
-  https://cloud.google.com/vertex-ai/docs/general/locations#available-regions
-
-  Args:
-    project_region: The region of the project.
-
-  Returns:
-    Supported region for hosting the labeling dataset.
-  """
-  if project_region.startswith('europe-'):
-    return 'europe-west4'
-  return 'us-central1'
-
-
 def main(unused_argv):
-  timestamp = time.strftime('%Y%m%d_%H%M%S')
-  timestamped_dataset = f'{FLAGS.dataset_name}_{timestamp}'
+  timestamped_dataset = utils.timestamped_name(FLAGS.dataset_name)
 
   if FLAGS.import_file_path:
     import_file_path = FLAGS.import_file_path
@@ -147,7 +126,7 @@ def main(unused_argv):
 
   cloud_labeling.create_cloud_labeling_job(
       FLAGS.cloud_project,
-      _get_labeling_dataset_region(FLAGS.cloud_location),
+      cloud_labeling.get_labeling_dataset_region(FLAGS.cloud_location),
       timestamped_dataset,
       FLAGS.label_classes,
       import_file_path,
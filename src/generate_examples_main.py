@@ -36,17 +36,17 @@ python generate_examples_main.py \
   --cloud_region=us-west1
 """
 
+from concurrent import futures
 import platform
-import time
 from typing import List
 
 from absl import app
 from absl import flags
 from absl import logging
-import shapely.geometry
 from skai import buildings
 from skai import generate_examples
 from skai import read_raster
+from skai import utils
 import tensorflow as tf
 
 FLAGS = flags.FLAGS
@@ -165,8 +165,6 @@ flags.DEFINE_string(
     'configuration_path', None, 'A path to a json configuration file'
 )
 
-Polygon = shapely.geometry.polygon.Polygon
-
 
 def _read_image_config(path: str) -> List[str]:
   with tf.io.gfile.GFile(path, 'r') as f:
@@ -184,8 +182,8 @@ def main(args):
   else:
     config = generate_examples.ExamplesGenerationConfig.init_from_flags(FLAGS)
 
-  timestamp = time.strftime('%Y%m%d-%H%M%S')
-  timestamped_dataset = f'{config.dataset_name}-{timestamp}'
+  # Dataflow job names may not contain underscores.
+  timestamped_dataset = utils.timestamped_name(config.dataset_name, '-')
 
   # If using Dataflow, check that the container image is valid.
   dataflow_container_image = config.dataflow_container_image
@@ -194,9 +192,10 @@ def main(args):
     dataflow_container_image = generate_examples.get_dataflow_container_image(
         py_version)
     if dataflow_container_image is None:
+      supported_versions = generate_examples.get_dataflow_python_versions()
       raise ValueError(
-          'Using Dataflow, your Python version should be 3.7, 3.8, 3.9 or'
-          f' 3.10, not {py_version}.'
+          'Using Dataflow, your Python version should be one of'
+          f' {", ".join(supported_versions)}, not {py_version}.'
       )
 
   gdal_env = generate_examples.parse_gdal_env(config.gdal_env)
@@ -222,35 +221,51 @@ def main(args):
     raise ValueError('At least labels_file (for labeled examples extraction) '
                      'or buildings_method != none (for unlabeled data) should '
                      'be specified.')
-  if config.buildings_method != 'none':
-    if config.aoi_path:
-      aois = buildings.read_aois(config.aoi_path)
+  # Building discovery and labels file reading are independent, so run them
+  # concurrently to overlap network and file I/O. The labels file is submitted
+  # first so that it is read while the AOIs are loaded.
+  with futures.ThreadPoolExecutor(max_workers=2) as executor:
+    if config.labels_file:
+      labeled_coordinates_future = executor.submit(
+          generate_examples.read_labels_file,
+          config.labels_file,
+          config.label_property,
+          config.labels_to_classes,
+          config.num_keep_labeled_examples,
+      )
     else:
-      aois = [read_raster.get_raster_bounds(path, gdal_env)
-              for path in after_image_patterns]
-    try:
-      building_centroids = generate_examples.get_building_centroids(
-          config, aois
+      labeled_coordinates_future = None
+
+    if config.buildings_method != 'none':
+      if config.aoi_path:
+        aois = buildings.read_aois(config.aoi_path)
+      else:
+        aois = [read_raster.get_raster_bounds(path, gdal_env)
+                for path in after_image_patterns]
+      building_centroids_future = executor.submit(
+          generate_examples.get_building_centroids, config, aois
       )
-    except generate_examples.NotInitializedEarthEngineError:
-      logging.fatal('Couldnot initialize Earth Engine.', exc_info=True)
-    except generate_examples.NoBuildingFoundError:
-      logging.fatal('No building is found.', exc_info=True)
-    logging.info('Found %d buildings in area of interest.',
-                 len(building_centroids))
-  else:
-    # Only if one wants to extract labeled examples and labels_file is provided.
-    building_centroids = []
+    else:
+      # Only if one wants to extract labeled examples and labels_file is
+      # provided.
+      building_centroids_future = None
 
-  if config.labels_file:
-    labeled_coordinates = generate_examples.read_labels_file(
-        config.labels_file,
-        config.label_property,
-        config.labels_to_classes,
-        config.num_keep_labeled_examples,
-    )
-  else:
-    labeled_coordinates = []
+    if building_centroids_future:
+      try:
+        building_centroids = building_centroids_future.result()
+      except generate_examples.NotInitializedEarthEngineError:
+        logging.fatal('Couldnot initialize Earth Engine.', exc_info=True)
+      except generate_examples.NoBuildingFoundError:
+        logging.fatal('No building is found.', exc_info=True)
+      logging.info('Found %d buildings in area of interest.',
+                   len(building_centroids))
+    else:
+      building_centroids = []
+
+    if labeled_coordinates_future:
+      labeled_coordinates = labeled_coordinates_future.result()
+    else:
+      labeled_coordinates = []
 
   generate_examples.generate_examples_pipeline(
       before_image_patterns,
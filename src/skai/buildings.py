@@ -14,17 +14,19 @@
 
 """Functions for reading building centroids from files."""
 
-from typing import List, Tuple
+from typing import List
 import geopandas as gpd
+import numpy as np
 import pandas as pd
 import shapely.geometry
+import shapely.ops
+from skai import utils
 import tensorflow as tf
 
-Point = shapely.geometry.point.Point
 Polygon = shapely.geometry.polygon.Polygon
 
 
-def _read_buildings_csv(path: str) -> List[Tuple[float, float]]:
+def _read_buildings_csv(path: str) -> np.ndarray:
   """Reads (longitude, latitude) coordinates from a CSV file.
 
   The file should contain "longitude" and "latitude" columns.
@@ -33,7 +35,7 @@ def _read_buildings_csv(path: str) -> List[Tuple[float, float]]:
     path: Path to CSV file.
 
   Returns:
-    List of (longitude, latitude) coordinates.
+    Array of (longitude, latitude) coordinates with shape (N, 2).
 
   Raises:
     ValueError if CSV file isn't formatted correctly.
@@ -44,11 +46,10 @@ def _read_buildings_csv(path: str) -> List[Tuple[float, float]]:
     raise ValueError(
         f'Malformed CSV file "{path}". File does not contain "longitude" and '
         '"latitude" columns')
-  return [(row.longitude, row.latitude) for _, row in df.iterrows()]
+  return df[['longitude', 'latitude']].to_numpy(dtype=np.float64)
 
 
-def read_buildings_file(path: str,
-                        regions: List[Polygon]) -> List[Tuple[float, float]]:
+def read_buildings_file(path: str, regions: List[Polygon]) -> np.ndarray:
   """Extracts building coordinates from a file.
 
   Supported file formats are csv, shapefile, and geojson.
@@ -58,27 +59,26 @@ def read_buildings_file(path: str,
     regions: Regions to where building coordinates should come from.
 
   Returns:
-    List of (longitude, latitude) building coordinates.
+    Array of (longitude, latitude) building coordinates with shape (N, 2).
   """
   if path.lower().endswith('.csv'):
     coords = _read_buildings_csv(path)
   else:
-    coords = []
-    df = gpd.read_file(path).to_crs(epsg=4326)
-    geometries = list(df.geometry.values)
-    for g in geometries:
-      centroid = g.centroid
-      coords.append((centroid.x, centroid.y))
+    with utils.localize_file(path) as local_path:
+      df = gpd.read_file(local_path).to_crs(epsg=4326)
+    centroids = df.geometry.centroid
+    coords = np.column_stack([centroids.x.to_numpy(), centroids.y.to_numpy()])
 
-  filtered_coords = []
-  for lon, lat in coords:
-    point = Point(lon, lat)
-    for region in regions:
-      if region.intersects(point):
-        filtered_coords.append((lon, lat))
-        break
+  if not len(coords):
+    return coords.reshape(-1, 2)
 
-  return filtered_coords
+  # Test all points against the union of the regions at once. The spatial
+  # index over the points prunes everything outside the regions' bounding box
+  # before the exact intersection test.
+  points = gpd.GeoSeries(gpd.points_from_xy(coords[:, 0], coords[:, 1]))
+  region_union = shapely.ops.unary_union(regions)
+  inside = np.sort(points.sindex.query(region_union, predicate='intersects'))
+  return coords[inside]
 
 
 def read_aois(path: str) -> List[Polygon]:
@@ -99,7 +99,8 @@ def read_aois(path: str) -> List[Polygon]:
     lines or points).
   """
   # Convert all data to long/lat
-  df = gpd.read_file(path).to_crs(epsg=4326)
+  with utils.localize_file(path) as local_path:
+    df = gpd.read_file(local_path).to_crs(epsg=4326)
   geometries = list(df.geometry.values)
   for g in geometries:
     if g.geometryType() not in ['Polygon', 'MultiPolygon']:
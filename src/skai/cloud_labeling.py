@@ -19,6 +19,7 @@ import functools
 import json
 import multiprocessing
 import os
+import posixpath
 import queue
 import random
 import time
@@ -55,6 +56,13 @@ IMPORT_FILE_NAME = 'import_file.jsonl'
 LABEL_SCHEMA_URI = ('gs://google-cloud-aiplatform/schema/datalabelingjob/'
                     'inputs/image_classification_1.0.0.yaml')
 
+# Regions that can host labeling datasets, keyed by the first component of a
+# project region name. As of November 2021, labeling datasets can only be
+# created in "us-central1" and "europe-west4". See
+# https://cloud.google.com/vertex-ai/docs/general/locations#available-regions
+_LABELING_DATASET_REGIONS = {'europe': 'europe-west4'}
+_DEFAULT_LABELING_DATASET_REGION = 'us-central1'
+
 Example = tf.train.Example
 Image = PIL.Image.Image
 
@@ -63,6 +71,19 @@ def _get_api_endpoint(cloud_location: str) -> str:
   return f'{cloud_location}-aiplatform.googleapis.com'
 
 
+def get_labeling_dataset_region(project_region: str) -> str:
+  """Chooses where to host a labeling dataset.
+
+  Args:
+    project_region: The region of the project.
+
+  Returns:
+    Supported region for hosting the labeling dataset.
+  """
+  return _LABELING_DATASET_REGIONS.get(
+      project_region.split('-', 1)[0], _DEFAULT_LABELING_DATASET_REGION)
+
+
 def _annotate_image(image: Image, caption: str) -> Image:
   """Adds center square and caption to image.
 
@@ -201,7 +222,7 @@ def create_labeling_images(
   if image_paths_queue.empty():
     return 0, None
 
-  import_file_path = os.path.join(output_dir, 'import_file.csv')
+  import_file_path = posixpath.join(output_dir, 'import_file.csv')
   num_images = image_paths_queue.qsize()
   with tf.io.gfile.GFile(import_file_path, 'w') as f:
     while not image_paths_queue.empty():
@@ -271,7 +292,7 @@ def _create_labeling_images_from_example_file(
     labeling_image = create_labeling_image(
         before_image, after_image, example_id, plus_code)
     labeling_image_bytes = utils.serialize_image(labeling_image, 'png')
-    path = os.path.join(output_dir, f'{example_id}.png')
+    path = posixpath.join(output_dir, f'{example_id}.png')
 
     try:
       _ = image_paths_queue.put_nowait(path)
@@ -298,7 +319,7 @@ def write_import_file(
         first ones by file sort order.
     output_path: Path to write import file to.
   """
-  images_pattern = os.path.join(images_dir, '*.png')
+  images_pattern = posixpath.join(images_dir, '*.png')
   image_files = sorted(tf.io.gfile.glob(images_pattern))
   if not image_files:
     raise ValueError(f'Pattern "{images_pattern}" did not match any images.')
@@ -466,7 +487,7 @@ def _read_label_annotations_file(path: str) -> Dict[str, str]:
 
 def _write_tfrecord(examples: Iterable[Example], path: str) -> None:
   """Writes a list of examples to a TFRecord file."""
-  output_dir = os.path.dirname(path)
+  output_dir = posixpath.dirname(path)
   if not tf.io.gfile.exists(output_dir):
     tf.io.gfile.makedirs(output_dir)
   with tf.io.TFRecordWriter(path) as writer:
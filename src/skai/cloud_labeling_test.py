@@ -46,6 +46,15 @@ class CloudLabelingTest(absltest.TestCase):
     self.assertEqual(labeling_image.width, 158)
     self.assertEqual(labeling_image.height, 116)
 
+  def testGetLabelingDatasetRegion(self):
+    self.assertEqual(
+        cloud_labeling.get_labeling_dataset_region('europe-west1'),
+        'europe-west4')
+    self.assertEqual(
+        cloud_labeling.get_labeling_dataset_region('us-west1'), 'us-central1')
+    self.assertEqual(
+        cloud_labeling.get_labeling_dataset_region('asia-east1'), 'us-central1')
+
   def testWriteImportFile(self):
     images_dir = tempfile.mkdtemp(dir=absltest.TEST_TMPDIR.value)
     image_files = [
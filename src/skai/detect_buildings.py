@@ -19,7 +19,7 @@ output a semantic sementation of the image.
 
 """
 
-import os
+import posixpath
 import shutil
 import tempfile
 from typing import Any, Iterable, Iterator, List, Set, Tuple, Optional, Dict
@@ -71,16 +71,16 @@ def _recursively_copy_directory(src_dir: str,
   # For reflecting the subdir structure of the source dir.
   dest_dir_current_path = dest_dir
   for src_dir_name, src_subdirs, src_leaf_files in tf.io.gfile.walk(src_dir):
-    dest_dir_current_path = os.path.join(dest_dir,
-                                         os.path.relpath(src_dir_name, src_dir))
+    dest_dir_current_path = posixpath.join(
+        dest_dir, posixpath.relpath(src_dir_name, src_dir))
     # Make the subdirectories
     for sub_dir in src_subdirs:
-      tf.io.gfile.mkdir(os.path.join(dest_dir, sub_dir))
+      tf.io.gfile.mkdir(posixpath.join(dest_dir, sub_dir))
 
     for leaf_file in src_leaf_files:
       tf.io.gfile.copy(
-          os.path.join(src_dir_name, leaf_file),
-          os.path.join(dest_dir_current_path, leaf_file), overwrite)
+          posixpath.join(src_dir_name, leaf_file),
+          posixpath.join(dest_dir_current_path, leaf_file), overwrite)
 
 
 def _load_tf_model(model_path: str) -> tf.Module:
@@ -19,16 +19,16 @@ import hashlib
 import itertools
 import json
 import logging
-import os
 import pathlib
 import pickle
+import posixpath
 from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 import apache_beam as beam
 import cv2
-import geopandas as gpd
 import numpy as np
 from openlocationcode import openlocationcode
+import pandas as pd
 import shapely.geometry
 from skai import buildings
 from skai import earth_engine
@@ -57,6 +57,16 @@ _MAX_DISPLACEMENT = 30
 # Code length generated by openlocationcode module.
 _PLUS_CODE_LENGTH = 14
 
+# Coordinates closer than this many degrees (about 1cm) are considered to be
+# the same point.
+_COORDINATE_PRECISION = 1e-7
+
+# Default Dataflow container images keyed by Python version.
+_DATAFLOW_CONTAINER_IMAGES = {
+    py_version: f'gcr.io/disaster-assessment/dataflow_{py_version}_image:latest'
+    for py_version in ('3.7', '3.8', '3.9', '3.10')
+}
+
 
 @dataclasses.dataclass
 class ExamplesGenerationConfig:
@@ -201,9 +211,7 @@ class NotInitializedEarthEngineError(Exception):
     super().__init__('Earth Engine could not be initialized.')
 
 
-def get_building_centroids(
-    config, regions: List[Polygon]
-) -> List[Tuple[float, float]]:
+def get_building_centroids(config, regions: List[Polygon]) -> np.ndarray:
   """Finds building centroids based on flag settings.
 
   This function is meant to be called from generate_examples_main.py.
@@ -214,7 +222,8 @@ def get_building_centroids(
     regions: List of polygons of regions to find buildings in.
 
   Returns:
-    List of building centroids in (longitude, latitude) format.
+    Array of building centroids in (longitude, latitude) format with shape
+    (N, 2).
 
   Raises:
     ValueError: if buildings_method flag has unknown value.
@@ -224,16 +233,17 @@ def get_building_centroids(
   if config.buildings_method == 'file':
     return buildings.read_buildings_file(config.buildings_file, regions)
   elif config.buildings_method == 'open_street_map':
-    return open_street_map.get_building_centroids_in_regions(
+    centroids = open_street_map.get_building_centroids_in_regions(
         regions, config.overpass_url
     )
+    return np.array(centroids, dtype=np.float64).reshape(-1, 2)
   elif config.buildings_method == 'open_buildings':
     if not earth_engine.initialize(
         config.earth_engine_service_account, config.earth_engine_private_key
     ):
       raise NotInitializedEarthEngineError()
     logging.info('Querying Open Buildings centroids. This may take a while.')
-    output_path = os.path.join(
+    output_path = posixpath.join(
         config.output_dir, 'open_buildings_centroids.csv'
     )
     centroids = earth_engine.get_open_buildings_centroids(
@@ -243,7 +253,7 @@ def get_building_centroids(
     if not centroids:
       raise NoBuildingFoundError()
     logging.info('Open Buildings centroids saved to %s', output_path)
-    return centroids
+    return np.array(centroids, dtype=np.float64)
 
   raise ValueError('Invalid value for "buildings_method" flag.')
 
@@ -643,12 +653,137 @@ def _generate_examples(
   return large_examples, small_examples
 
 
+def _parse_labels_to_classes(labels_to_classes: List[str]) -> Dict[str, float]:
+  """Parses a list of label to class mappings into a dictionary.
+
+  Args:
+    labels_to_classes: List of string in "label=class" format, e.g.
+      ["undamaged=0", "damaged=1", "destroyed=1"].
+
+  Returns:
+    Dictionary mapping label strings to float classes.
+
+  Raises:
+    ValueError: if a mapping is malformed or its class is not numeric.
+  """
+  label_to_class_dict = {}
+  for label_to_class in labels_to_classes:
+    if '=' not in label_to_class:
+      raise ValueError(
+          f'Invalid label to class mapping "{label_to_class}", '
+          'should have form "label=class".')
+    label, _, numeric_class = label_to_class.partition('=')
+    try:
+      label_to_class_dict[label] = float(numeric_class)
+    except ValueError:
+      logging.error('Class %s is not numeric.', numeric_class)
+      raise
+  return label_to_class_dict
+
+
+def _to_grid_cells(coordinates: np.ndarray) -> np.ndarray:
+  """Snaps finite longitudes and latitudes to integer grid cells."""
+  return np.round(coordinates[:, :2] / _COORDINATE_PRECISION).astype(np.int64)
+
+
+def _count_locations(coordinates: np.ndarray) -> int:
+  """Counts the distinct valid locations that deduplication would keep."""
+  finite = np.isfinite(coordinates[:, :2]).all(axis=1)
+  return len(np.unique(_to_grid_cells(coordinates[finite]), axis=0))
+
+
+def _deduplicate_coordinates(coordinates: np.ndarray) -> np.ndarray:
+  """Removes coordinates with invalid or duplicate locations.
+
+  If the coordinates have a label column and duplicates of a location have
+  different labels, a warning is logged and the first label is kept.
+
+  Rows with non-finite longitude or latitude, e.g. centroids of empty
+  geometries, are dropped with a warning.
+
+  Args:
+    coordinates: Array whose first two columns are longitude and latitude.
+
+  Returns:
+    Coordinates with invalid and duplicate locations removed, keeping the first
+    occurrence of each location in the original order.
+  """
+  finite = np.isfinite(coordinates[:, :2]).all(axis=1)
+  if not finite.all():
+    logging.warning(
+        'Dropped %d coordinates with missing or non-finite locations.',
+        np.count_nonzero(~finite))
+    coordinates = coordinates[finite]
+  if not len(coordinates):
+    return coordinates
+  _, first_indices, inverse = np.unique(
+      _to_grid_cells(coordinates), axis=0, return_index=True,
+      return_inverse=True)
+  if coordinates.shape[1] > 2:
+    labels = coordinates[:, 2]
+    first_labels = labels[first_indices[inverse.reshape(-1)]]
+    conflicting = ~((labels == first_labels) |
+                    (np.isnan(labels) & np.isnan(first_labels)))
+    if conflicting.any():
+      logging.warning(
+          '%d coordinates share a location with a differently labeled '
+          'coordinate. Keeping the first label at each location.',
+          np.count_nonzero(conflicting))
+  deduplicated = coordinates[np.sort(first_indices)]
+  if len(deduplicated) < len(coordinates):
+    logging.info(
+        'Removed %d of %d coordinates with duplicate locations.',
+        len(coordinates) - len(deduplicated), len(coordinates))
+  return deduplicated
+
+
+def _get_labeled_coordinates(
+    df: pd.DataFrame, label_property: str, label_to_class_dict: Dict[str, float]
+) -> Tuple[np.ndarray, np.ndarray]:
+  """Extracts labeled centroid coordinates from a GeoDataFrame.
+
+  Args:
+    df: GeoDataFrame of labeled geometries.
+    label_property: The property to use as the label.
+    label_to_class_dict: Mapping from string labels to float classes.
+
+  Returns:
+    Array of (longitude, latitude, float label) rows with shape (N, 3), one
+    per row of df, and a boolean mask of the rows whose string label is not
+    recognized.
+  """
+  df = df.to_crs(epsg=4326)
+  centroids = df.geometry.centroid
+  longitudes = centroids.x.to_numpy()
+  latitudes = centroids.y.to_numpy()
+  labels = df[label_property]
+  # infer_dtype looks at the values, so object columns are classified the same
+  # way on every pandas version.
+  label_type = pd.api.types.infer_dtype(labels, skipna=False)
+  if label_type in ('integer', 'floating', 'mixed-integer-float', 'boolean'):
+    float_labels = labels.to_numpy(dtype=np.float64)
+    is_string = np.zeros(len(labels), dtype=bool)
+  elif label_type in ('string', 'empty'):
+    float_labels = labels.map(label_to_class_dict).to_numpy(dtype=np.float64)
+    # GDAL promotes fields that mix numbers and strings to strings, so labels
+    # that aren't class names but parse as numbers are used as-is.
+    unmapped = np.isnan(float_labels)
+    float_labels[unmapped] = pd.to_numeric(
+        labels[unmapped], errors='coerce').to_numpy(dtype=np.float64)
+    is_string = np.ones(len(labels), dtype=bool)
+  else:
+    raise ValueError(f'Unrecognized label property type {label_type}')
+
+  coordinates = np.column_stack([longitudes, latitudes, float_labels])
+  return coordinates, is_string & np.isnan(float_labels)
+
+
 def read_labels_file(
     path: str,
     label_property: str,
     labels_to_classes: List[str] = None,
     max_points: int = None
-) -> List[Tuple[float, float, float]]:
+) -> np.ndarray:
   """Reads labels from a GIS file.
 
   If the "label_property" is a string, then it is assumed to be the name of a
@@ -657,7 +792,9 @@ def read_labels_file(
   "labels_to_classes", the example is dropped.
 
   If the label is a float or integer, it is read as-is without labels_to_classes
-  specified.
+  specified. String labels that are not in "labels_to_classes" but parse as
+  numbers, e.g. "1", are also read as-is, since GDAL reads fields mixing
+  numbers and strings as strings.
 
   Args:
     path: Path to the file to be read.
@@ -667,41 +804,52 @@ def read_labels_file(
     max_points: Number of labeled examples to keep
 
   Returns:
-    List of tuples of the form (longitude, latitude, float label).
+    Array of (longitude, latitude, float label) rows with shape (N, 3). Rows
+    at duplicate locations are removed, keeping the first.
   """
-  # Parse labels_to_classes into dictionary format if specified
-  if labels_to_classes:
-    label_to_class_dict = {}
-    for label_to_class in labels_to_classes:
-      if '=' not in label_to_class:
-        raise ValueError(
-            f'Invalid label to class mapping "{label_to_class}",'
-            f'should have form "label=class".')
-      label, numeric_class = label_to_class.split('=')
-      try:
-        label_to_class_dict[label] = float(numeric_class)
-      except TypeError:
-        logging.error('Class %s is not numeric.', numeric_class)
-        raise
-
-  # Generate coordinates from label file
-  df = gpd.read_file(path).to_crs(epsg=4326)
-  coordinates = []
-  for _, row in df.iterrows():
-    centroid = row.geometry.centroid
-    label = row[label_property]
-    if isinstance(label, str):
-      try:
-        float_label = label_to_class_dict[label]
-      except KeyError:
-        logging.warning('Label %s is not recognized.', label)
-    elif isinstance(label, (int, float)):
-      float_label = float(label)
-    else:
-      raise ValueError(f'Unrecognized label property type {type(label)}')
+  # Beam workers import this module to unpickle its DoFns, and the prebuilt
+  # Dataflow worker images don't include pyogrio. Import it here so that only
+  # the launcher needs it, and only when a labels file is read.
+  import pyogrio
 
-    coordinates.append((centroid.x, centroid.y, float_label))
+  label_to_class_dict = _parse_labels_to_classes(labels_to_classes or [])
 
+  # Only the label column is read, so unused attributes are never parsed.
+  if max_points:
+    # First read a prefix of the file that likely holds enough recognized
+    # labels. The file is opened in place rather than localized, so for remote
+    # files GDAL fetches only the data it needs (over /vsigs/ for gs:// URIs)
+    # instead of downloading the whole object.
+    max_features = 2 * max_points
+    df = pyogrio.read_dataframe(
+        path, columns=[label_property], max_features=max_features)
+    coordinates, unrecognized = _get_labeled_coordinates(
+        df, label_property, label_to_class_dict)
+    if (len(df) == max_features and
+        _count_locations(coordinates[~unrecognized]) < max_points):
+      # The prefix was too short, so read the whole file. Only the rows after
+      # the prefix are decoded again.
+      with utils.localize_file(path) as local_path:
+        df = pyogrio.read_dataframe(local_path, columns=[label_property])
+      rest_coordinates, rest_unrecognized = _get_labeled_coordinates(
+          df.iloc[max_features:], label_property, label_to_class_dict)
+      coordinates = np.concatenate([coordinates, rest_coordinates])
+      unrecognized = np.concatenate([unrecognized, rest_unrecognized])
+  else:
+    with utils.localize_file(path) as local_path:
+      df = pyogrio.read_dataframe(local_path, columns=[label_property])
+    coordinates, unrecognized = _get_labeled_coordinates(
+        df, label_property, label_to_class_dict)
+
+  # Warnings are logged once, after all rows that will be used are decoded.
+  if unrecognized.any():
+    for label in df[label_property][unrecognized].unique():
+      logging.warning('Label %s is not recognized.', label)
+    coordinates = coordinates[~unrecognized]
+
+  # Duplicates are removed before the max_points cut so that exactly
+  # max_points distinct locations are kept when the file has enough.
+  coordinates = _deduplicate_coordinates(coordinates)
   if max_points:
     coordinates = coordinates[:max_points]
 
@@ -709,24 +857,21 @@ def read_labels_file(
   return coordinates
 
 
-def get_dataflow_container_image(py_version: str) -> str:
+def get_dataflow_container_image(py_version: str) -> Optional[str]:
   """Gets default dataflow image based on Python version.
 
   Args:
     py_version: Python version
   Returns:
-    Dataflow container image path.
+    Dataflow container image path, or None if the Python version has no
+    default image.
   """
-  if py_version == '3.7':
-    return 'gcr.io/disaster-assessment/dataflow_3.7_image:latest'
-  elif py_version == '3.8':
-    return 'gcr.io/disaster-assessment/dataflow_3.8_image:latest'
-  elif py_version == '3.9':
-    return 'gcr.io/disaster-assessment/dataflow_3.9_image:latest'
-  elif py_version == '3.10':
-    return 'gcr.io/disaster-assessment/dataflow_3.10_image:latest'
-  else:
-    return None
+  return _DATAFLOW_CONTAINER_IMAGES.get(py_version)
+
+
+def get_dataflow_python_versions() -> List[str]:
+  """Returns the Python versions that have a default Dataflow image."""
+  return list(_DATAFLOW_CONTAINER_IMAGES)
 
 
 def parse_gdal_env(settings: List[str]) -> Dict[str, str]:
@@ -738,14 +883,12 @@ def parse_gdal_env(settings: List[str]) -> Dict[str, str]:
   Returns:
     Dictionary with variable as key and assigned value.
   """
-  gdal_env = {}
-  for setting in settings:
-    if '=' not in setting:
-      raise ValueError(
-          'Each GDAL environment setting should have the form "var=value".')
-    var, _, value = setting.partition('=')
-    gdal_env[var] = value
-  return gdal_env
+  invalid_settings = [setting for setting in settings if '=' not in setting]
+  if invalid_settings:
+    raise ValueError(
+        'Each GDAL environment setting should have the form "var=value". '
+        f'Invalid settings: {", ".join(invalid_settings)}')
+  return dict(setting.split('=', 1) for setting in settings)
 
 
 def generate_examples_pipeline(before_image_patterns: List[str],
@@ -753,9 +896,8 @@ def generate_examples_pipeline(before_image_patterns: List[str],
                                large_patch_size: int, example_patch_size: int,
                                resolution: float, output_dir: str,
                                num_output_shards: int,
-                               unlabeled_coordinates: List[Tuple[float, float]],
-                               labeled_coordinates: List[Tuple[float, float,
-                                                               float]],
+                               unlabeled_coordinates: np.ndarray,
+                               labeled_coordinates: np.ndarray,
                                use_dataflow: bool, gdal_env: Dict[str, str],
                                dataflow_job_name: Optional[str],
                                dataflow_container_image: Optional[str],
@@ -774,10 +916,10 @@ def generate_examples_pipeline(before_image_patterns: List[str],
     resolution: Desired resolution of image patches.
     output_dir: Parent output directory.
     num_output_shards: Number of output shards.
-    unlabeled_coordinates: List of coordinates (longitude, latitude) to extract
-      unlabeled examples for.
-    labeled_coordinates: List of coordinates (longitude, latitude, label) to
-      extract labeled examples for.
+    unlabeled_coordinates: Array of (longitude, latitude) coordinates with
+      shape (N, 2) to extract unlabeled examples for.
+    labeled_coordinates: Array of (longitude, latitude, label) coordinates with
+      shape (N, 3) to extract labeled examples for.
     use_dataflow: If true, run pipeline on GCP Dataflow.
     gdal_env: GDAL environment configuration.
     dataflow_job_name: Name of dataflow job.
@@ -788,7 +930,7 @@ def generate_examples_pipeline(before_image_patterns: List[str],
     max_workers: Maximum number of workers to use.
   """
 
-  temp_dir = os.path.join(output_dir, 'temp')
+  temp_dir = posixpath.join(output_dir, 'temp')
   if use_dataflow:
     if cloud_project is None or cloud_region is None:
       raise ValueError(
@@ -803,22 +945,31 @@ def generate_examples_pipeline(before_image_patterns: List[str],
   else:
     pipeline_options = _get_local_pipeline_options()
 
-  coordinates_path = os.path.join(temp_dir, 'coordinates')
-  if unlabeled_coordinates:
+  unlabeled_coordinates = _deduplicate_coordinates(np.asarray(
+      unlabeled_coordinates, dtype=np.float64).reshape(-1, 2))
+  labeled_coordinates = np.asarray(
+      labeled_coordinates, dtype=np.float64).reshape(-1, 3)
+
+  # The coordinates file is unpickled by Beam workers, so convert to Python
+  # objects only at this boundary.
+  coordinates_path = posixpath.join(temp_dir, 'coordinates')
+  if len(unlabeled_coordinates):
     small_examples_output_prefix = (
-        os.path.join(output_dir, 'examples', 'unlabeled', 'unlabeled'))
+        posixpath.join(output_dir, 'examples', 'unlabeled', 'unlabeled'))
     large_examples_output_prefix = (
-        os.path.join(output_dir, 'examples', 'unlabeled-large', 'unlabeled'))
-    labeled_coordinates = [(longitude, latitude, -1.0)
-                           for longitude, latitude in unlabeled_coordinates]
-    utils.write_coordinates_file(labeled_coordinates, coordinates_path)
-
-  elif labeled_coordinates:
+        posixpath.join(output_dir, 'examples', 'unlabeled-large', 'unlabeled'))
+    labeled_coordinates = np.column_stack([
+        unlabeled_coordinates,
+        np.full(len(unlabeled_coordinates), -1.0),
+    ])
+    utils.write_coordinates_file(labeled_coordinates.tolist(), coordinates_path)
+
+  elif len(labeled_coordinates):
     small_examples_output_prefix = (
-        os.path.join(output_dir, 'examples', 'labeled', 'labeled'))
+        posixpath.join(output_dir, 'examples', 'labeled', 'labeled'))
     large_examples_output_prefix = (
-        os.path.join(output_dir, 'examples', 'labeled-large', 'labeled'))
-    utils.write_coordinates_file(labeled_coordinates, coordinates_path)
+        posixpath.join(output_dir, 'examples', 'labeled-large', 'labeled'))
+    utils.write_coordinates_file(labeled_coordinates.tolist(), coordinates_path)
 
   with beam.Pipeline(options=pipeline_options) as pipeline:
     large_examples, small_examples = _generate_examples(
@@ -15,10 +15,11 @@
 """Tests for generate_examples.py."""
 
 import glob
+import json
 import os
 import pathlib
 import tempfile
-from typing import Any, List, Tuple
+from typing import Any, List, Optional, Tuple
 
 from absl.testing import absltest
 from absl.testing import parameterized
@@ -27,6 +28,7 @@ from apache_beam.testing import test_pipeline
 from apache_beam.testing.util import assert_that
 from apache_beam.testing.util import equal_to
 import numpy as np
+import pyogrio
 from skai import generate_examples
 from skai import utils
 import tensorflow as tf
@@ -180,6 +182,29 @@ def _check_examples(
   return _check_examples_internal
 
 
+def _write_labels_file(
+    labels: List[Any],
+    path: str,
+    longitudes: Optional[List[float]] = None,
+) -> None:
+  """Writes a GeoJSON file of points with a "label" property."""
+  if longitudes is None:
+    longitudes = [178.48 + i * 0.001 for i in range(len(labels))]
+  features = [
+      {
+          'type': 'Feature',
+          'geometry': {
+              'type': 'Point',
+              'coordinates': [longitude, -16.63],
+          },
+          'properties': {'label': label},
+      }
+      for longitude, label in zip(longitudes, labels)
+  ]
+  with open(path, 'w') as f:
+    json.dump({'type': 'FeatureCollection', 'features': features}, f)
+
+
 class GenerateExamplesTest(parameterized.TestCase):
 
   def setUp(self):
@@ -379,6 +404,122 @@ class GenerateExamplesTest(parameterized.TestCase):
     tfrecords = os.listdir(os.path.join(output_dir, 'examples', 'unlabeled'))
     self.assertSameElements(tfrecords, ['unlabeled-00000-of-00001.tfrecord'])
 
+  def testReadLabelsFileStringLabels(self):
+    path = os.path.join(absltest.TEST_TMPDIR.value, 'string_labels.geojson')
+    _write_labels_file(['undamaged', 'damaged', 'unknown', 'destroyed'], path)
+    coordinates = generate_examples.read_labels_file(
+        path, 'label', ['undamaged=0', 'damaged=1', 'destroyed=1']
+    )
+    self.assertTrue(
+        np.allclose(
+            coordinates,
+            [(178.48, -16.63, 0.0), (178.481, -16.63, 1.0),
+             (178.483, -16.63, 1.0)],
+        )
+    )
+
+  def testReadLabelsFileMixedLabels(self):
+    path = os.path.join(absltest.TEST_TMPDIR.value, 'mixed_labels.geojson')
+    _write_labels_file(['damaged', 1, 'unknown', '0.5'], path)
+    # GDAL promotes a field mixing numbers and strings to a string field.
+    self.assertEqual(
+        pyogrio.read_dataframe(path)['label'].tolist(),
+        ['damaged', '1', 'unknown', '0.5'],
+    )
+    coordinates = generate_examples.read_labels_file(
+        path, 'label', ['damaged=1']
+    )
+    self.assertTrue(
+        np.allclose(
+            coordinates,
+            [(178.48, -16.63, 1.0), (178.481, -16.63, 1.0),
+             (178.483, -16.63, 0.5)],
+        )
+    )
+
+  def testReadLabelsFileNumericLabels(self):
+    path = os.path.join(absltest.TEST_TMPDIR.value, 'numeric_labels.geojson')
+    _write_labels_file([0, 1, 0], path)
+    coordinates = generate_examples.read_labels_file(
+        path, 'label', max_points=2
+    )
+    self.assertTrue(
+        np.allclose(
+            coordinates, [(178.48, -16.63, 0.0), (178.481, -16.63, 1.0)]
+        )
+    )
+
+  def testReadLabelsFileMaxPointsReadsPastUnrecognizedLabels(self):
+    path = os.path.join(absltest.TEST_TMPDIR.value, 'sparse_labels.geojson')
+    _write_labels_file(['unknown', 'unknown', 'unknown', 'damaged'], path)
+    with self.assertLogs(level='WARNING') as logs:
+      coordinates = generate_examples.read_labels_file(
+          path, 'label', ['damaged=1'], max_points=1
+      )
+    self.assertTrue(np.allclose(coordinates, [(178.483, -16.63, 1.0)]))
+    # The prefix is decoded once, so each warning is only logged once.
+    self.assertLen(
+        [line for line in logs.output if 'unknown is not recognized' in line], 1
+    )
+
+  def testReadLabelsFileDeduplicatesBeforeMaxPoints(self):
+    path = os.path.join(absltest.TEST_TMPDIR.value, 'duplicate_labels.geojson')
+    _write_labels_file(
+        [0, 1, 1, 0], path, longitudes=[178.48, 178.48, 178.481, 178.482]
+    )
+    with self.assertLogs(level='WARNING'):
+      coordinates = generate_examples.read_labels_file(
+          path, 'label', max_points=2
+      )
+    self.assertTrue(
+        np.allclose(
+            coordinates, [(178.48, -16.63, 0.0), (178.481, -16.63, 1.0)]
+        )
+    )
+
+  @parameterized.named_parameters(
+      dict(testcase_name='missing_equals', labels_to_classes=['damaged']),
+      dict(testcase_name='non_numeric_class', labels_to_classes=['damaged=a']),
+  )
+  def testReadLabelsFileInvalidLabelsToClasses(self, labels_to_classes):
+    path = os.path.join(absltest.TEST_TMPDIR.value, 'invalid_labels.geojson')
+    _write_labels_file(['damaged'], path)
+    with self.assertRaises(ValueError):
+      generate_examples.read_labels_file(path, 'label', labels_to_classes)
+
+  def testParseGdalEnv(self):
+    self.assertEqual(
+        generate_examples.parse_gdal_env(['A=1', 'B=x=y']),
+        {'A': '1', 'B': 'x=y'},
+    )
+
+  def testParseGdalEnvRaises(self):
+    with self.assertRaisesRegex(ValueError, 'B, C'):
+      generate_examples.parse_gdal_env(['A=1', 'B', 'C'])
+
+  def testGetDataflowContainerImage(self):
+    self.assertEqual(
+        generate_examples.get_dataflow_container_image('3.9'),
+        'gcr.io/disaster-assessment/dataflow_3.9_image:latest',
+    )
+    self.assertIsNone(generate_examples.get_dataflow_container_image('3.6'))
+    self.assertCountEqual(
+        generate_examples.get_dataflow_python_versions(),
+        ['3.7', '3.8', '3.9', '3.10'],
+    )
+
+  def testDeduplicateCoordinates(self):
+    coordinates = np.array([
+        [178.48, -16.63, 0.0],
+        [178.49, -16.63, 1.0],
+        [178.48 + 1e-9, -16.63, 1.0],
+        [178.48, -16.64, 0.0],
+        [np.nan, np.nan, 1.0],
+        [np.nan, -16.65, 0.0],
+    ])
+    deduplicated = generate_examples._deduplicate_coordinates(coordinates)
+    np.testing.assert_array_equal(deduplicated, coordinates[[0, 1, 3]])
+
   def testConfigLoadedCorrectlyFromJsonFile(self):
     config = generate_examples.ExamplesGenerationConfig.init_from_json_path(
         self.test_config_path
@@ -16,6 +16,7 @@
 Please see https://wiki.openstreetmap.org/wiki/Overpass_API for details.
 """
 
+from concurrent import futures
 from typing import Dict, List, Optional, Tuple
 import xml.etree.ElementTree as ET
 import requests
@@ -24,6 +25,10 @@ import shapely.geometry
 Polygon = shapely.geometry.polygon.Polygon
 Point = shapely.geometry.point.Point
 
+# Maximum number of regions queried concurrently. Public Overpass servers only
+# allow a few simultaneous requests per client, so keep this small.
+_MAX_CONCURRENT_QUERIES = 4
+
 
 def _read_nodes(xml: str, region: Polygon) -> Dict[str, Point]:
   """Parses OSM Overpass response XML into a dict of points.
@@ -133,8 +138,13 @@ def get_building_centroids_in_regions(
   Returns:
     A list of building centroids in all regions.
   """
-  centroids = []
-  for region in regions:
-    polygons = get_buildings_in_region(region, overpass_url)
-    centroids.extend([(p.centroid.x, p.centroid.y) for p in polygons])
+  if not regions:
+    return []
+  num_workers = min(_MAX_CONCURRENT_QUERIES, len(regions))
+  with futures.ThreadPoolExecutor(max_workers=num_workers) as executor:
+    polygons_per_region = executor.map(
+        lambda region: get_buildings_in_region(region, overpass_url), regions)
+    centroids = []
+    for polygons in polygons_per_region:
+      centroids.extend([(p.centroid.x, p.centroid.y) for p in polygons])
   return centroids
@@ -13,6 +13,8 @@
 # limitations under the License.
 """Tests for open_street_map.py."""
 
+from unittest import mock
+
 from absl.testing import absltest
 import shapely.geometry
 
@@ -107,6 +109,20 @@ class OpenStreetMapTest(absltest.TestCase):
                  (-122.0, 38.0)]),
     ])
 
+  def testGetBuildingCentroidsInRegions(self):
+    regions = [Polygon.from_bounds(i, 0, i + 1, 1) for i in range(6)]
+
+    def _buildings_in_region(region, unused_overpass_url):
+      left, bottom, right, top = region.bounds
+      return [Polygon.from_bounds(left, bottom, right, top)]
+
+    with mock.patch.object(
+        open_street_map, 'get_buildings_in_region',
+        side_effect=_buildings_in_region):
+      centroids = open_street_map.get_building_centroids_in_regions(
+          regions, 'http://overpass')
+    self.assertEqual(centroids, [(i + 0.5, 0.5) for i in range(6)])
+
 
 if __name__ == '__main__':
   absltest.main()
@@ -29,7 +29,7 @@ import abc
 import dataclasses
 import functools
 import json
-import os.path
+import posixpath
 from typing import Any, Dict, List, Optional, Tuple, Type
 
 import numpy as np
@@ -144,7 +144,7 @@ class TrainingParams:
       print('%-32s %s' % (k, v))
 
   def save_args(self, arg_dir: str):
-    with tf.gfile.Open(os.path.join(arg_dir, 'args.json'), 'w') as f:
+    with tf.gfile.Open(posixpath.join(arg_dir, 'args.json'), 'w') as f:
       json.dump(self.to_dict(), f, sort_keys=True, indent=4)
 
 
@@ -264,15 +264,15 @@ class Model(abc.ABC):
 
   @property
   def arg_dir(self):
-    return os.path.join(self._train_dir, _ARGS_DIRNAME)
+    return posixpath.join(self._train_dir, _ARGS_DIRNAME)
 
   @property
   def checkpoint_dir(self):
-    return os.path.join(self._train_dir, _MODEL_AND_CHECKPOINT_DIRNAME)
+    return posixpath.join(self._train_dir, _MODEL_AND_CHECKPOINT_DIRNAME)
 
   @property
   def tensorboard_dir(self):
-    return os.path.join(self._train_dir, _TENSORBOARD_LOGS_DIRNAME)
+    return posixpath.join(self._train_dir, _TENSORBOARD_LOGS_DIRNAME)
 
   def _create_initial_files(self, params: TrainingParams):
     for folder in (self.checkpoint_dir, self.arg_dir):
@@ -282,14 +282,14 @@ class Model(abc.ABC):
 
   @classmethod
   def load(cls: Type['Model'], train_dir: str):
-    with open(os.path.join(train_dir, 'args/args.json'), 'r') as f:
+    with open(posixpath.join(train_dir, 'args/args.json'), 'r') as f:
       params = json.load(f)
     instance = cls(train_dir=train_dir, **params)
     return instance
 
   def experiment_name(self, params: TrainingParams):
     args = [x + str(y) for x, y in sorted(params.to_dict().items())]
-    return os.path.join(self.__class__.__name__, '_'.join(args))
+    return posixpath.join(self.__class__.__name__, '_'.join(args))
 
   def load_checkpoint(self,
                       session: tf.Session,
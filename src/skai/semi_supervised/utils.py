@@ -16,6 +16,7 @@
 """
 
 import os
+import posixpath
 import re
 
 import numpy as np
@@ -69,7 +70,7 @@ def find_latest_checkpoint(folder):
     string, file name of the latest checkpoint.
   """
   r_step = re.compile(r'.*model\.ckpt-(?P<step>\d+)\.meta')
-  matches = tf.gfile.Glob(os.path.join(folder, 'model.ckpt-*.meta'))
+  matches = tf.gfile.Glob(posixpath.join(folder, 'model.ckpt-*.meta'))
   matches = [(int(r_step.match(x).group('step')), x) for x in matches]
   ckpt_file = max(matches)[1][:-5]
   return ckpt_file
@@ -102,7 +103,7 @@ def get_latest_global_step_in_subdir(folder):
     int, the global step of the latest checkpoint or 0 if none was found.
   """
   sub_dirs = (
-      x for x in tf.gfile.Glob(os.path.join(folder, '*'))
+      x for x in tf.gfile.Glob(posixpath.join(folder, '*'))
       if tf.gfile.Stat(x).IsDirectory())
   step = 0
   for x in sub_dirs:
@@ -15,11 +15,16 @@
 """Utility functions for skai package."""
 
 import base64
+import contextlib
+import datetime
 import io
 import os
 import pickle
+import posixpath
+import shutil
 import struct
-from typing import Any, Iterable, List, Tuple
+import tempfile
+from typing import Any, Iterable, Iterator, List, Tuple
 
 from absl import flags
 import PIL.Image
@@ -28,6 +33,10 @@ import tensorflow as tf
 Example = tf.train.Example
 Image = PIL.Image.Image
 
+# URI schemes of remote files that should be copied locally before being read
+# by GIS libraries.
+_REMOTE_SCHEMES = ('gs://', 's3://')
+
 
 def serialize_image(image: Image, image_format: str) -> bytes:
   """Serialize image using the specified format.
@@ -121,7 +130,7 @@ def decode_coordinates(encoded_coords: str) -> Tuple[float, float]:
 
 
 def write_coordinates_file(coordinates: List[Any], path: str) -> None:
-  output_dir = os.path.dirname(path)
+  output_dir = posixpath.dirname(path)
   if not tf.io.gfile.exists(output_dir):
     tf.io.gfile.makedirs(output_dir)
   with tf.io.gfile.GFile(path, 'wb') as f:
@@ -131,3 +140,62 @@ def write_coordinates_file(coordinates: List[Any], path: str) -> None:
 def read_coordinates_file(path: str) -> List[Any]:
   with tf.io.gfile.GFile(path, 'rb') as f:
     return pickle.load(f)
+
+
+@contextlib.contextmanager
+def localize_file(path: str) -> Iterator[str]:
+  """Copies a remote file to a local temporary directory.
+
+  GIS libraries read remote files through many small range requests, which is
+  slow for cloud storage. Downloading the file once up front is much faster.
+  For shapefiles, all sidecar files (e.g. ".dbf", ".shx", ".prj") are copied
+  as well. Local paths are returned unchanged.
+
+  Args:
+    path: Path or URI of the file.
+
+  Yields:
+    Local path of the file. Temporary copies are deleted on exit.
+  """
+  if not path.startswith(_REMOTE_SCHEMES):
+    yield path
+    return
+
+  remote_dir, file_name = posixpath.split(path)
+  stem, extension = posixpath.splitext(file_name)
+  if extension.lower() == '.shp':
+    # List the directory instead of globbing so that special characters in the
+    # file name are not treated as wildcards.
+    file_names = [
+        name for name in tf.io.gfile.listdir(remote_dir)
+        if name.startswith(f'{stem}.')
+    ]
+  else:
+    file_names = [file_name]
+  temp_dir = tempfile.mkdtemp()
+  try:
+    for name in file_names:
+      tf.io.gfile.copy(
+          posixpath.join(remote_dir, name), os.path.join(temp_dir, name))
+    yield os.path.join(temp_dir, file_name)
+  finally:
+    shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def timestamped_name(name: str, separator: str = '_') -> str:
+  """Appends the current UTC time and process id to a name.
+
+  The process id keeps names unique when several jobs are launched within the
+  same second.
+
+  Args:
+    name: Base name, e.g. a dataset name.
+    separator: String placed between the name, date, time, and process id.
+
+  Returns:
+    Name of the form "<name><sep><YYYYmmdd><sep><HHMMSS><sep><pid>", where
+    <sep> is the separator.
+  """
+  now = datetime.datetime.now(datetime.timezone.utc)
+  return separator.join(
+      [name, f'{now:%Y%m%d}', f'{now:%H%M%S}', str(os.getpid())])
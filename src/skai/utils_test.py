@@ -0,0 +1,91 @@
+# Copyright 2021 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for utils.py."""
+
+import os
+from unittest import mock
+
+from absl.testing import absltest
+from skai import utils
+import tensorflow as tf
+
+
+def _fake_copy(unused_src: str, dst: str) -> None:
+  with open(dst, 'w'):
+    pass
+
+
+class UtilsTest(absltest.TestCase):
+
+  def testLocalizeFileLocalPath(self):
+    path = utils.get_test_file_path('test_data/aoi.geojson')
+    with utils.localize_file(path) as local_path:
+      self.assertEqual(local_path, path)
+
+  def testLocalizeFileRemoteShapefile(self):
+    remote_files = [
+        'buildings.shp',
+        'buildings.dbf',
+        'buildings.shx',
+        'buildings.prj',
+        'buildings_v2.shp',
+        'other.dbf',
+    ]
+    with mock.patch.object(
+        tf.io.gfile, 'listdir', return_value=remote_files
+    ), mock.patch.object(
+        tf.io.gfile, 'copy', side_effect=_fake_copy
+    ) as mock_copy:
+      with utils.localize_file('gs://bucket/dir/buildings.shp') as local_path:
+        temp_dir = os.path.dirname(local_path)
+        self.assertEqual(os.path.basename(local_path), 'buildings.shp')
+        self.assertCountEqual(
+            os.listdir(temp_dir),
+            ['buildings.shp', 'buildings.dbf', 'buildings.shx',
+             'buildings.prj'])
+      self.assertIn(
+          mock.call('gs://bucket/dir/buildings.dbf',
+                    os.path.join(temp_dir, 'buildings.dbf')),
+          mock_copy.call_args_list)
+    self.assertFalse(os.path.exists(temp_dir))
+
+  def testLocalizeFileRemoteGeoJSON(self):
+    with mock.patch.object(
+        tf.io.gfile, 'copy', side_effect=_fake_copy
+    ) as mock_copy:
+      with utils.localize_file('gs://bucket/[a]*.geojson') as local_path:
+        temp_dir = os.path.dirname(local_path)
+        self.assertEqual(os.path.basename(local_path), '[a]*.geojson')
+        self.assertTrue(os.path.exists(local_path))
+    mock_copy.assert_called_once_with(
+        'gs://bucket/[a]*.geojson', os.path.join(temp_dir, '[a]*.geojson'))
+    self.assertFalse(os.path.exists(temp_dir))
+
+  def testTimestampedName(self):
+    name = utils.timestamped_name('dataset')
+    prefix, date, time, pid = name.split('_')
+    self.assertEqual(prefix, 'dataset')
+    self.assertRegex(date, r'^\d{8}$')
+    self.assertRegex(time, r'^\d{6}$')
+    self.assertEqual(pid, str(os.getpid()))
+
+  def testTimestampedNameSeparator(self):
+    name = utils.timestamped_name('my_dataset', '-')
+    self.assertRegex(name, r'^my_dataset-\d{8}-\d{6}-\d+$')
+    self.assertTrue(name.endswith(f'-{os.getpid()}'))
+
+
+if __name__ == '__main__':
+  absltest.main()
@@ -24,7 +24,7 @@ If not, there is a warning logged that the metrics should be ignored in
 inference mode.
 """
 
-import os
+import posixpath
 import re
 import time
 from typing import Dict, Set
@@ -81,7 +81,7 @@ def _CreateFileWriter(
   Returns:
     Newly created FileWriter.
   """
-  return tf.summary.FileWriter(os.path.join(tensorboard_dir))
+  return tf.summary.FileWriter(posixpath.join(tensorboard_dir))
 
 
 def _MakeSummary(tag: str, value: float) -> tf.Summary:
@@ -129,7 +129,7 @@ def _SaveLastProcessedEpoch(checkpoint_dir: str, epoch: int):
     epoch: Integer of last processed epoch.
   """
   with tf.gfile.Open(
-      os.path.join(checkpoint_dir, LAST_PROCESSED_EPOCH_FILE),
+      posixpath.join(checkpoint_dir, LAST_PROCESSED_EPOCH_FILE),
       'w') as last_processed_epoch_file:
     last_processed_epoch_file.write(str(epoch))
 
@@ -206,8 +206,8 @@ def _WritePreds(preds_with_coords: train.PredictionsWithCoordinates,
     epoch: Training epoch number.
   """
   preds_file_name = f'{dataset}_ckpt_{epoch}.geojson'
-  preds_file_path = os.path.join(FLAGS.train_dir, 'predictions',
-                                 preds_file_name)
+  preds_file_path = posixpath.join(FLAGS.train_dir, 'predictions',
+                                   preds_file_name)
   with tf.gfile.GFile(preds_file_path, 'w') as preds_file:
     preds_dict = {
         'longitude': preds_with_coords.lons,
@@ -246,9 +246,9 @@ def _SavePredictionsToFile(
 def _GetAlreadyProcessedCheckpoints(all_checkpoints: Set[str]) -> Set[str]:
   """Gets the set already processed checkpoints."""
   processed_checkpoints = set()
-  last_processed_epoch_file_path = os.path.join(FLAGS.train_dir,
-                                                FLAGS.dataset_name,
-                                                LAST_PROCESSED_EPOCH_FILE)
+  last_processed_epoch_file_path = posixpath.join(FLAGS.train_dir,
+                                                  FLAGS.dataset_name,
+                                                  LAST_PROCESSED_EPOCH_FILE)
   if tf.gfile.Exists(last_processed_epoch_file_path):
     with tf.gfile.Open(last_processed_epoch_file_path,
                        'r') as last_processed_epoch_file:
@@ -272,10 +272,10 @@ def _FindCheckpoints(checkpoint_dir: str) -> Set[str]:
   """
   checkpoints = set()
   checkpoint_pattern = re.compile(
-      os.path.join(checkpoint_dir, 'model.ckpt-[0-9]*.meta'))
+      posixpath.join(checkpoint_dir, 'model.ckpt-[0-9]*.meta'))
   for dirname, _, filenames in tf.gfile.Walk(checkpoint_dir):
     for filename in filenames:
-      full_filepath = os.path.join(dirname, filename)
+      full_filepath = posixpath.join(dirname, filename)
       match = checkpoint_pattern.match(full_filepath)
       if match:
         checkpoints.add(match.group())